@@ -30,12 +30,27 @@ class error(Exception):
     pass
 
 
+def _build_crc16_table():
+    table = []
+    for data in range(256):
+        crc = data
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0x8408
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC16_TABLE = _build_crc16_table()
+
+
 def crc16_ccitt(buf):
     crc = 0xFFFF
+    table = CRC16_TABLE
     for data in buf:
-        data ^= crc & 0xFF
-        data ^= (data & 0x0F) << 4
-        crc = ((data << 8) | (crc >> 8)) ^ (data >> 4) ^ (data << 3)
+        crc = (crc >> 8) ^ table[(crc ^ data) & 0xFF]
     return [crc >> 8, crc & 0xFF]
 
 